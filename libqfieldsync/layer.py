@@ -129,6 +129,22 @@ class LayerSource(object):
         AttachmentType.VIDEO: "'video/{layername}_' || format_date(now(),'yyyyMMddhhmmsszzz') || '.{{extension}}'",
     }
 
+    @classmethod
+    def is_both_removed(cls, layer: QgsMapLayer) -> bool:
+        """Returns True when the layer is explicitly configured to be removed
+        from both the cable and the cloud export.
+
+        Only reads the two action custom properties, so callers can skip the
+        full `LayerSource` construction (which parses the datasource and reads
+        a dozen more properties) for layers they would discard anyway. Layers
+        without explicitly configured actions return False and need the full
+        object to resolve their defaults.
+        """
+        return (
+            layer.customProperty("QFieldSync/action") == SyncAction.REMOVE
+            and layer.customProperty("QFieldSync/cloud_action") == SyncAction.REMOVE
+        )
+
     def __init__(
         self, layer: QgsMapLayer, project: Optional[QgsProject] = None
     ) -> None:
@@ -19,7 +19,11 @@
  ***************************************************************************/
 """
 
+import concurrent.futures
 import sys
+import time
+import zipfile
+from contextlib import contextmanager
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Union
@@ -32,8 +36,6 @@ from qgis.core import (
     QgsCoordinateTransform,
     QgsCubicRasterResampler,
     QgsEditorWidgetSetup,
-    QgsField,
-    QgsFields,
     QgsMapLayer,
     QgsPolygon,
     QgsProcessingContext,
@@ -44,7 +46,14 @@ from qgis.core import (
     QgsVectorLayer,
     QgsLayerTreeGroup,
 )
-from qgis.PyQt.QtCore import QCoreApplication, QObject, pyqtSignal
+from qgis.PyQt.QtCore import QCoreApplication, QMetaMethod, QObject, pyqtSignal
+from qgis.PyQt.QtXml import QDomDocument
+
+try:
+    # NOTE if qgis is built without GUI, there is no `qgis.utils`, since it depends on `qgis.gui`
+    from qgis import utils as _qgis_utils
+except Exception:
+    _qgis_utils = None
 
 from .layer import LayerSource, SyncAction
 from .offliners import BaseOffliner
@@ -56,17 +65,41 @@ from .utils.xml import get_themapcanvas
 
 FID_NULL = -4294967296
 
+# actions that copy the layer source next to the exported project file
+_COPY_ACTIONS = frozenset((SyncAction.COPY, SyncAction.NO_ACTION))
+
+
+@contextmanager
+def _signal_connected(signal, slot):
+    """Keeps `slot` connected to `signal` for the duration of the block.
+
+    Unlike manual connect/disconnect pairs, the connection is released even
+    when the block raises, so no stale connections are left behind.
+    """
+    signal.connect(slot)
+    try:
+        yield
+    finally:
+        signal.disconnect(slot)
+
+
 if sys.version_info >= (3, 8):
     from typing import TypedDict
 
+    class FieldSpec(TypedDict):
+        type: int
+        ews_type: str
+        ews_config: Dict
+
     class LayerData(TypedDict):
         id: str
         name: str
         source: str
         type: int
-        fields: Optional[QgsFields]
+        fields: Optional[Dict[str, FieldSpec]]
 
 else:
+    FieldSpec = Dict
     LayerData = Dict
 
 
@@ -96,9 +129,12 @@ class OfflineConverter(QObject):
     ):
         super(OfflineConverter, self).__init__(parent=None)
         self.__max_task_progress = 0
+        self.__last_task_pct = -1
         self.__convertor_progress = None  # for processing feedback
         self.__layer_data_by_id: Dict[str, LayerData] = {}
         self.__offline_layer_names: List[str] = []
+        self.__layer_id_by_remote_source: Dict[str, str] = {}
+        self.__layer_id_by_name: Dict[str, str] = {}
 
         # elipsis workaround
         self.trUtf8 = self.tr
@@ -146,9 +182,17 @@ class OfflineConverter(QObject):
             self._convert(project)
         finally:
             if reload_original_project:
-                QCoreApplication.processEvents()
-                QgsProject.instance().clear()
-                QCoreApplication.processEvents()
+                # pumping the event loop only matters with a GUI attached; in
+                # headless runs it just re-enters arbitrary queued Qt slots
+                has_gui = QgsApplication.instance().platform() == "desktop"
+
+                if has_gui:
+                    QCoreApplication.processEvents()
+
+                project.clear()
+
+                if has_gui:
+                    QCoreApplication.processEvents()
 
                 open_project(str(self.original_filename), self.backup_filename)
 
@@ -170,39 +214,30 @@ class OfflineConverter(QObject):
         else:
             raise NotImplementedError(f"Unknown package type: {self.export_type}")
 
-        # Set flags that usually significantly speed-up project file read
-        read_flags = QgsProject.ReadFlags()
-        read_flags |= QgsProject.FlagDontResolveLayers
-        read_flags |= QgsProject.FlagDontLoadLayouts
-        if Qgis.versionInt() >= 32600:
-            read_flags |= QgsProject.FlagDontLoad3DViews
-
-        # Make a new function object that we can connect and disconnect easily
-        on_original_project_read = self._on_original_project_read_wrapper(
-            xml_elements_to_preserve
+        # Harvest `theMapCanvas` straight from the project XML. Even a flagged
+        # `QgsProject.read()` still parses and instantiates the whole project;
+        # plain DOM parsing gives us the one element we preserve for free.
+        xml_elements_to_preserve["map_canvas"] = self._read_map_canvas_element(
+            tmp_project_filename
         )
 
-        # Create a new temporary `QgsProject` instance just to make sure that `theMapCanvas`
-        # XML object is properly set within the XML document. Using a new `QgsProject`
-        # instead of the singleton `QgsProject.instance()` allows using the read flags.
-        tmp_project = QgsProject()
-        tmp_project.readProject.connect(on_original_project_read)
-        tmp_project.read(tmp_project_filename, read_flags)
-        tmp_project.readProject.disconnect(on_original_project_read)
-
-        # NOTE force delete the `QgsProject`, otherwise the `QgsApplication` might be deleted by the time the project is garbage collected
-        del tmp_project
-
         self._export_filename.parent.mkdir(parents=True, exist_ok=True)
         self.total_progress_updated.emit(0, 100, self.trUtf8("Converting project…"))
 
         project_layers: List[QgsMapLayer] = list(project.mapLayers().values())
         offline_layers: List[QgsMapLayer] = []
         copied_files = list()
+        layer_ids_to_remove: List[str] = []
 
         if self.create_basemap and self.project_configuration.create_base_map:
             self._export_basemap()
 
+        total_layers_count = len(project_layers)
+        copying_layers_msg = self.trUtf8("Copying layers…")
+        last_progress_pct = -1
+        # the export type was validated above, so a single bool covers both kinds
+        is_cable_export = self.export_type == ExportType.Cable
+
         # We store the pks of the original vector layers
         for layer_idx, layer in enumerate(project_layers):
             layer_source = LayerSource(layer)
@@ -217,7 +252,7 @@ class OfflineConverter(QObject):
                         logger.warning(
                             f'Layer "{layer.name()}" cannot be packaged and will be removed because "{reason}".'
                         )
-                        project.removeMapLayer(layer)
+                        layer_ids_to_remove.append(layer.id())
                         break
                     else:
                         logger.warning(
@@ -227,21 +262,40 @@ class OfflineConverter(QObject):
                 # do not attempt to package the layer
                 continue
 
+            # each accessor is a Python->C++ hop, so query the layer once per loop
+            layer_id = layer.id()
+            layer_type = layer.type()
+
+            # snapshot the fields as plain Python data: the original project is
+            # cleared after packaging, so the snapshot must not keep live
+            # QgsFields objects alive, and the post-processing reads would each
+            # cross the SIP boundary again
+            field_specs: Optional[Dict[str, FieldSpec]] = None
+            # only vector layers have fields; checking the already fetched type
+            # is cheaper than a `hasattr` probe through the SIP wrapper
+            if layer_type == QgsMapLayer.VectorLayer:
+                field_specs = {}
+                for field in layer.fields():
+                    ews = field.editorWidgetSetup()
+                    field_specs[field.name()] = {
+                        "type": field.type(),
+                        "ews_type": ews.type(),
+                        "ews_config": ews.config(),
+                    }
+
             layer_data: LayerData = {
-                "id": layer.id(),
+                "id": layer_id,
                 "name": layer.name(),
-                "type": layer.type(),
+                "type": layer_type,
                 "source": layer.source(),
-                "fields": layer.fields() if hasattr(layer, "fields") else None,
+                "fields": field_specs,
             }
 
             layer_action = (
-                layer_source.action
-                if self.export_type == ExportType.Cable
-                else layer_source.cloud_action
+                layer_source.action if is_cable_export else layer_source.cloud_action
             )
 
-            if layer.isValid() and layer.type() == QgsMapLayer.VectorLayer:
+            if layer_type == QgsMapLayer.VectorLayer and layer.isValid():
                 if layer_source.pk_attr_name:
                     # NOTE even though `QFieldSync/sourceDataPrimaryKeys` is in plural, we never supported composite (multi-column) PKs and always stored a single value
                     layer.setCustomProperty(
@@ -249,28 +303,31 @@ class OfflineConverter(QObject):
                     )
                 else:
                     # The layer has no supported PK, so we mark it as readonly and just copy it when packaging in the cloud
-                    if self.export_type == ExportType.Cloud:
+                    if not is_cable_export:
                         layer_action = SyncAction.NO_ACTION
                         layer.setReadOnly(True)
                         layer.setCustomProperty("QFieldSync/unsupported_source_pk", "1")
 
-            self.__layer_data_by_id[layer.id()] = layer_data
+            self.__layer_data_by_id[layer_id] = layer_data
 
             # `QFieldSync/remoteLayerId` should be equal to `remoteLayerId`, which is already set by `QgsOfflineEditing`. We add this as a copy to have control over this attribute that might suddenly change on QGIS.
-            layer.setCustomProperty("QFieldSync/remoteLayerId", layer.id())
-
-            self.total_progress_updated.emit(
-                layer_idx,
-                len(project_layers),
-                self.trUtf8("Copying layers…"),
-            )
+            layer.setCustomProperty("QFieldSync/remoteLayerId", layer_id)
+
+            # emit only when the visible percentage changes; with hundreds of
+            # layers a per-layer emit makes connected GUI slots repaint each time
+            progress_pct = layer_idx * 100 // total_layers_count
+            if progress_pct != last_progress_pct:
+                last_progress_pct = progress_pct
+                self.total_progress_updated.emit(
+                    layer_idx,
+                    total_layers_count,
+                    copying_layers_msg,
+                )
 
             if layer_action == SyncAction.OFFLINE:
                 offline_layers.append(layer)
                 self.__offline_layer_names.append(layer.name())
-            elif (
-                layer_action == SyncAction.COPY or layer_action == SyncAction.NO_ACTION
-            ):
+            elif layer_action in _COPY_ACTIONS:
                 copied_files = layer_source.copy(
                     self._export_filename.parent,
                     copied_files,
@@ -278,17 +335,32 @@ class OfflineConverter(QObject):
             elif layer_action == SyncAction.KEEP_EXISTENT:
                 layer_source.copy(self._export_filename.parent, copied_files, True)
             elif layer_action == SyncAction.REMOVE:
-                project.removeMapLayer(layer)
+                layer_ids_to_remove.append(layer_id)
+
+        if layer_ids_to_remove:
+            # a single `removeMapLayers()` emits `layersWillBeRemoved`/`layersRemoved`
+            # once for the whole batch, instead of notifying all listeners per layer
+            project.removeMapLayers(layer_ids_to_remove)
 
         self.remove_empty_groups_from_layer_tree_group(project.layerTreeRoot())
 
         export_project_filename = self._export_filename
+        # Path->str conversions allocate, so do them once per conversion
+        export_project_str = str(export_project_filename)
+        original_filename_str = str(self.original_filename)
 
         # save the original project path
-        self.project_configuration.original_project_path = str(self.original_filename)
+        self.project_configuration.original_project_path = original_filename_str
+
+        # restore `theMapCanvas` on every written document, so the last write
+        # always has it, no matter whether a second write happens at all
+        on_original_project_write = self._on_original_project_write_wrapper(
+            xml_elements_to_preserve
+        )
 
         # save the offline project twice so that the offline plugin can "know" that it's a relative path
-        QgsProject.instance().write(str(export_project_filename))
+        with _signal_connected(project.writeProject, on_original_project_write):
+            project.write(export_project_str)
 
         if self.dirs_to_copy is None:
             dirs_to_copy = {}
@@ -297,18 +369,38 @@ class OfflineConverter(QObject):
         else:
             dirs_to_copy = self.dirs_to_copy
 
-        for source_dir, should_copy in dirs_to_copy.items():
-            if not should_copy:
-                continue
-
-            copy_attachments(
-                self.original_filename.parent,
-                export_project_filename.parent,
-                Path(source_dir),
-            )
+        attachment_dirnames = [
+            Path(source_dir)
+            for source_dir, should_copy in dirs_to_copy.items()
+            if should_copy
+        ]
+
+        # copying attachment directories is I/O bound, so overlap them in threads
+        if len(attachment_dirnames) > 1:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(4, len(attachment_dirnames))
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        copy_attachments,
+                        self.original_filename.parent,
+                        export_project_filename.parent,
+                        dirname,
+                    )
+                    for dirname in attachment_dirnames
+                ]
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()
+        else:
+            for dirname in attachment_dirnames:
+                copy_attachments(
+                    self.original_filename.parent,
+                    export_project_filename.parent,
+                    dirname,
+                )
 
         # copy project plugin if present
-        plugin_file = Path("{}.qml".format(str(self.original_filename)[:-4]))
+        plugin_file = Path("{}.qml".format(original_filename_str[:-4]))
         if plugin_file.exists():
             copy_multifile(
                 plugin_file, export_project_filename.parent.joinpath(plugin_file.name)
@@ -317,10 +409,11 @@ class OfflineConverter(QObject):
         if offline_layers:
             bbox = None
             if self.project_configuration.offline_copy_only_aoi:
+                # `area_of_interest_crs` is already a `QgsCoordinateReferenceSystem`
                 bbox = QgsCoordinateTransform(
-                    QgsCoordinateReferenceSystem(self.area_of_interest_crs),
-                    QgsProject.instance().crs(),
-                    QgsProject.instance(),
+                    self.area_of_interest_crs,
+                    project.crs(),
+                    project,
                 ).transformBoundingBox(self.area_of_interest.boundingBox())
 
             is_success = self.offliner.convert_to_offline(
@@ -341,13 +434,18 @@ class OfflineConverter(QObject):
             # project with offline layers
             self.post_process_offline_layers()
 
-        # Now we have a project state which can be saved as offline project
-        on_original_project_write = self._on_original_project_write_wrapper(
-            xml_elements_to_preserve
-        )
-        project.writeProject.connect(on_original_project_write)
-        QgsProject.instance().write(str(export_project_filename))
-        project.writeProject.disconnect(on_original_project_write)
+            # only the offline conversion modified the project since the first
+            # write, so skip the second full XML serialization without it
+            with _signal_connected(project.writeProject, on_original_project_write):
+                project.write(export_project_str)
+
+    def _has_warning_listeners(self) -> bool:
+        """Whether any slot is connected to the `warning` signal.
+
+        Building the translated warning messages is pointless in headless runs
+        where nothing listens, so callers can skip it entirely.
+        """
+        return self.isSignalConnected(QMetaMethod.fromSignal(self.warning))
 
     def remove_empty_groups_from_layer_tree_group(
         self, group: QgsLayerTreeGroup
@@ -378,6 +476,16 @@ class OfflineConverter(QObject):
         else:
             project.setAutoTransaction(False)
 
+        # index the packaged layers once, so the value relation post-processing
+        # does not rescan all project layers for every single field
+        self.__layer_id_by_remote_source.clear()
+        self.__layer_id_by_name.clear()
+        for e_layer in project.mapLayers().values():
+            remote_source = e_layer.customProperty("remoteSource")
+            if remote_source:
+                self.__layer_id_by_remote_source.setdefault(remote_source, e_layer.id())
+            self.__layer_id_by_name.setdefault(e_layer.name(), e_layer.id())
+
         # check if value relations point to offline layers and adjust if necessary
         for e_layer in project.mapLayers().values():
             if e_layer.type() == QgsMapLayer.VectorLayer:
@@ -386,12 +494,13 @@ class OfflineConverter(QObject):
                     not remote_layer_id
                     or remote_layer_id not in self.__layer_data_by_id
                 ):
-                    self.warning.emit(
-                        self.tr("QFieldSync"),
-                        self.tr(
-                            'Failed to find layer with name "{}". QFieldSync will not package that layer.'
-                        ).format(e_layer.name()),
-                    )
+                    if self._has_warning_listeners():
+                        self.warning.emit(
+                            self.tr("QFieldSync"),
+                            self.tr(
+                                'Failed to find layer with name "{}". QFieldSync will not package that layer.'
+                            ).format(e_layer.name()),
+                        )
                     continue
 
                 self.post_process_fields(e_layer)
@@ -400,30 +509,30 @@ class OfflineConverter(QObject):
         remote_layer_id = e_layer.customProperty("QFieldSync/remoteLayerId")
         e_layer_source = LayerSource(e_layer)
         o_layer_data = self.__layer_data_by_id[remote_layer_id]
-        o_layer_fields: QgsFields = o_layer_data["fields"]  # type: ignore
-        o_layer_field_names = o_layer_fields.names()
+        o_field_specs: Dict[str, FieldSpec] = o_layer_data["fields"]  # type: ignore
+        e_layer_fields = e_layer.fields()
 
         for e_field_name in e_layer_source.visible_fields_names():
-            if e_field_name not in o_layer_field_names:
+            o_field_spec = o_field_specs.get(e_field_name)
+
+            if o_field_spec is None:
                 # handles the `fid` column, that is present only for gpkg
                 e_layer.setEditorWidgetSetup(
-                    e_layer.fields().indexFromName(e_field_name),
+                    e_layer_fields.indexFromName(e_field_name),
                     QgsEditorWidgetSetup("Hidden", {}),
                 )
                 continue
 
-            o_field = o_layer_fields.field(e_field_name)
-            o_ews = o_field.editorWidgetSetup()
-
-            if o_ews.type() == "ValueRelation":
-                self.post_process_value_relation_fields(e_layer, o_field)
+            if o_field_spec["ews_type"] == "ValueRelation":
+                self.post_process_value_relation_fields(
+                    e_layer, e_field_name, o_field_spec
+                )
 
     def post_process_value_relation_fields(
-        self, e_layer: QgsVectorLayer, o_field: QgsField
+        self, e_layer: QgsVectorLayer, o_field_name: str, o_field_spec: FieldSpec
     ):
         project = QgsProject.instance()
-        o_ews = o_field.editorWidgetSetup()
-        o_widget_config = o_ews.config()
+        o_widget_config = o_field_spec["ews_config"]
         o_referenced_layer_id = o_widget_config["Layer"]
 
         if o_referenced_layer_id not in self.__layer_data_by_id:
@@ -438,64 +547,57 @@ class OfflineConverter(QObject):
 
         # yet another check whether value relation resolver succeeded
         if o_referenced_layer_id not in self.__layer_data_by_id:
-            self.warning.emit(
-                self.tr("Bad attribute form configuration"),
-                self.tr(
-                    'Field "{}" in layer "{}" has no configured layer in the value relation widget.'
-                ).format(o_field.name(), e_layer.name()),
-            )
+            if self._has_warning_listeners():
+                self.warning.emit(
+                    self.tr("Bad attribute form configuration"),
+                    self.tr(
+                        'Field "{}" in layer "{}" has no configured layer in the value relation widget.'
+                    ).format(o_field_name, e_layer.name()),
+                )
             return
 
-        e_referenced_layer_id = None
-        for e_layer in project.mapLayers().values():
-            o_layer_data = self.__layer_data_by_id[o_referenced_layer_id]
-
-            if e_layer.customProperty("remoteSource") == o_layer_data["source"]:
-                #  First try strict matching: the offline layer should have a "remoteSource" property
-                e_referenced_layer_id = e_layer.id()
-                break
-            elif e_layer.name() == o_layer_data["name"]:
-                #  If that did not work, go with loose matching
-                e_referenced_layer_id = e_layer.id()
-                break
+        o_layer_data = self.__layer_data_by_id[o_referenced_layer_id]
+        #  First try strict matching: the offline layer should have a "remoteSource" property,
+        #  if that did not work, go with loose matching by name
+        e_referenced_layer_id = self.__layer_id_by_remote_source.get(
+            o_layer_data["source"]
+        ) or self.__layer_id_by_name.get(o_layer_data["name"])
 
         if not e_referenced_layer_id:
-            self.warning.emit(
-                self.tr("Bad attribute form configuration"),
-                self.tr(
-                    'Field "{}" in layer "{}" has no configured layer in the value relation widget.'
-                ).format(o_field.name(), e_layer.name()),
-            )
+            if self._has_warning_listeners():
+                self.warning.emit(
+                    self.tr("Bad attribute form configuration"),
+                    self.tr(
+                        'Field "{}" in layer "{}" has no configured layer in the value relation widget.'
+                    ).format(o_field_name, e_layer.name()),
+                )
             return
 
         e_widget_config = o_widget_config
         e_widget_config["Layer"] = e_referenced_layer_id
         e_layer.setEditorWidgetSetup(
-            e_layer.fields().indexOf(o_field.name()),
-            QgsEditorWidgetSetup(o_ews.type(), e_widget_config),
+            e_layer.fields().indexOf(o_field_name),
+            QgsEditorWidgetSetup(o_field_spec["ews_type"], e_widget_config),
         )
 
     def _export_basemap_requirements_check(self) -> bool:
-        try:
-            # NOTE if qgis is built without GUI, there is no `qgis.utils`, since it depends on `qgis.gui`
-            import qgis.utils
+        if _qgis_utils is None:
+            return False
 
-            # TODO investigate why starPlugin fails in docker
-            # print(1111111111010301, qgis.utils.loadPlugin("processing"))
-            # print(1111111111010302, qgis.utils.startPlugin("processing"))
+        # TODO investigate why starPlugin fails in docker
+        # print(1111111111010301, _qgis_utils.loadPlugin("processing"))
+        # print(1111111111010302, _qgis_utils.startPlugin("processing"))
 
-            if "processing" in qgis.utils.plugins:
-                return True
+        if "processing" in _qgis_utils.plugins:
+            return True
 
-            self.warning.emit(
-                self.tr('QFieldSync requires "processing" plugin'),
-                self.tr(
-                    "Creating a basemap with QFieldSync requires the processing plugin to be enabled. Processing is not enabled on your system. Please go to Plugins > Manage and Install Plugins and enable processing."
-                ),
-            )
-            self.total_progress_updated.emit(0, 0, self.trUtf8("Cancelled"))
-        except Exception:
-            pass
+        self.warning.emit(
+            self.tr('QFieldSync requires "processing" plugin'),
+            self.tr(
+                "Creating a basemap with QFieldSync requires the processing plugin to be enabled. Processing is not enabled on your system. Please go to Plugins > Manage and Install Plugins and enable processing."
+            ),
+        )
+        self.total_progress_updated.emit(0, 0, self.trUtf8("Cancelled"))
 
         return False
 
@@ -540,10 +642,22 @@ class OfflineConverter(QObject):
 
             # we need to transform the extent to match the one of the selected layer
             extent = QgsCoordinateTransform(
-                QgsCoordinateReferenceSystem(self.area_of_interest_crs),
+                self.area_of_interest_crs,
                 project.crs(),
                 project,
             ).transformBoundingBox(basemap_extent)
+
+            # do not rasterize tiles the layer has no data for: clamp the AOI
+            # to the layer's own extent, transformed into the project CRS
+            layer_extent = QgsCoordinateTransform(
+                basemap_layer.crs(),
+                project.crs(),
+                project,
+            ).transformBoundingBox(basemap_layer.extent())
+            clamped_extent = extent.intersect(layer_extent)
+
+            if not clamped_extent.isEmpty():
+                extent = clamped_extent
         elif base_map_type == ProjectProperties.BaseMapType.MAP_THEME:
             if not project.mapThemeCollection().hasMapTheme(
                 self.project_configuration.base_map_theme
@@ -585,7 +699,7 @@ class OfflineConverter(QObject):
 
         feedback = QgsProcessingFeedback()
         context = QgsProcessingContext()
-        context.setProject(QgsProject.instance())
+        context.setProject(project)
 
         results, ok = alg.run(params, context, feedback)
 
@@ -599,7 +713,7 @@ class OfflineConverter(QObject):
         resample_filter.setZoomedInResampler(QgsCubicRasterResampler())
         resample_filter.setZoomedOutResampler(QgsBilinearRasterResampler())
         self.project_configuration.project.addMapLayer(new_layer, False)
-        layer_tree = QgsProject.instance().layerTreeRoot()
+        layer_tree = project.layerTreeRoot()
         layer_tree.insertLayer(len(layer_tree.children()), new_layer)
 
         return True
@@ -612,27 +726,62 @@ class OfflineConverter(QObject):
 
     def _on_offline_editing_max_changed(self, _, mode_count):
         self.__max_task_progress = mode_count
+        self.__last_task_pct = -1
 
-    def _on_original_project_read_wrapper(self, elements):
-        def on_original_project_read(doc):
-            if not elements.get("map_canvas"):
-                elements["map_canvas"] = elements.get(
-                    "map_canvas", get_themapcanvas(doc)
-                )
+    def _read_map_canvas_element(self, project_filename: str):
+        """Extracts the "theMapCanvas" DOM element from a project file.
 
-        return on_original_project_read
+        Parses the `.qgs`/`.qgz` file as plain XML — unlike `QgsProject.read()`
+        this touches no data provider, layout or style.
+        """
+        try:
+            if project_filename.lower().endswith(".qgz"):
+                with zipfile.ZipFile(project_filename) as zip_file:
+                    qgs_names = [
+                        name
+                        for name in zip_file.namelist()
+                        if name.lower().endswith(".qgs")
+                    ]
+
+                    if not qgs_names:
+                        return None
+
+                    content = zip_file.read(qgs_names[0])
+            else:
+                with open(project_filename, "rb") as f:
+                    content = f.read()
+        except OSError:
+            return None
+
+        doc = QDomDocument()
+        if not doc.setContent(content):
+            return None
+
+        return get_themapcanvas(doc)
 
     def _on_original_project_write_wrapper(self, elements):
         def on_original_project_write(doc):
-            if not get_themapcanvas(doc) and elements.get("map_canvas"):
-                doc.elementsByTagName("qgis").at(0).appendChild(
-                    elements.get("map_canvas")
-                )
+            map_canvas = elements.get("map_canvas")
+
+            # check the cached element first, so the document is not traversed
+            # at all when there is no canvas to restore
+            if map_canvas is not None and not get_themapcanvas(doc):
+                doc.elementsByTagName("qgis").at(0).appendChild(map_canvas)
 
         return on_original_project_write
 
     def _on_offline_editing_task_progress(self, progress):
-        self.task_progress_updated.emit(progress, self.__max_task_progress)
+        max_progress = self.__max_task_progress
+
+        if max_progress > 0:
+            # the offliner reports once per feature; forward only integer
+            # percentage changes so downstream GUI slots do not run per row
+            pct = progress * 100 // max_progress
+            if pct == self.__last_task_pct:
+                return
+            self.__last_task_pct = pct
+
+        self.task_progress_updated.emit(progress, max_progress)
 
     def convertorProcessingProgress(self):
         """
@@ -645,6 +794,8 @@ class OfflineConverter(QObject):
 
             def __init__(self):
                 QObject.__init__(self)
+                self._last_emit = 0.0
+                self._last_percentage = -5
 
             def error(self, msg):
                 pass
@@ -653,6 +804,19 @@ class OfflineConverter(QObject):
                 pass
 
             def setPercentage(self, i):
+                # pumping the event loop on every single percent re-enters Qt
+                # thousands of times for fast algorithms, so only pass on
+                # updates every 5% or 100ms, plus the final one
+                now = time.monotonic()
+                if (
+                    i < 100
+                    and i - self._last_percentage < 5
+                    and now - self._last_emit < 0.1
+                ):
+                    return
+
+                self._last_percentage = i
+                self._last_emit = now
                 self.progress_updated.emit(i, 100)
                 QCoreApplication.processEvents()
 
@@ -36,6 +36,21 @@ CUSTOM_PROPERTY_LAYERNAME_SUFFIX = "layerNameSuffix"
 PROJECT_ENTRY_SCOPE_OFFLINE = "OfflineEditingPlugin"
 PROJECT_ENTRY_KEY_OFFLINE_DB_PATH = "/OfflineDbPath"
 
+# the QGIS version cannot change at runtime, so resolve the geometry-less
+# geometry types once at import time instead of per layer
+if Qgis.QGIS_VERSION_INT >= 33000:
+    _NO_GEOMETRY_TYPES = (
+        Qgis.GeometryType.Null,
+        Qgis.GeometryType.Unknown,
+    )
+else:
+    from qgis.core import QgsWkbTypes
+
+    _NO_GEOMETRY_TYPES = (
+        QgsWkbTypes.GeometryType.NullGeometry,
+        QgsWkbTypes.GeometryType.UnknownGeometry,
+    )
+
 
 class OfflinerType(str, Enum):
     QGISCORE = "qgiscore"
@@ -97,27 +112,31 @@ class QgisCoreOffliner(BaseOffliner):
         # If `bbox` is valid and not empty
         if bbox and bbox.isFinite():
             only_selected = True
+            project_crs = project.crs()
+            # constructing a transform touches the proj database, so share one
+            # per CRS between layers; an empty authid means a custom CRS that
+            # cannot be used as a safe cache key
+            transform_by_authid = {}
             for layer in layers:
-                if Qgis.QGIS_VERSION_INT >= 33000:
-                    no_geometry_types = [
-                        Qgis.GeometryType.Null,
-                        Qgis.GeometryType.Unknown,
-                    ]
-                else:
-                    from qgis.core import QgsWkbTypes
-
-                    no_geometry_types = [
-                        QgsWkbTypes.GeometryType.NullGeometry,
-                        QgsWkbTypes.GeometryType.UnknownGeometry,
-                    ]
-
-                if layer.geometryType() in no_geometry_types:
+                if layer.geometryType() in _NO_GEOMETRY_TYPES:
                     # ensure that geometry-less layers do not have selected features that would interfere with the process
                     layer.removeSelection()
                 else:
-                    tr = QgsCoordinateTransform(project.crs(), layer.crs(), project)
+                    authid = layer.crs().authid()
+                    tr = transform_by_authid.get(authid)
+                    if tr is None:
+                        tr = QgsCoordinateTransform(project_crs, layer.crs(), project)
+                        if authid:
+                            transform_by_authid[authid] = tr
                     layer_bbox = tr.transform(bbox)
-                    layer.selectByRect(layer_bbox)
+
+                    if layer_bbox.intersects(layer.extent()):
+                        layer.selectByRect(layer_bbox)
+                    else:
+                        # a disjoint AOI cannot select any feature, so skip the
+                        # spatial query, which is a remote roundtrip for
+                        # providers like PostGIS
+                        layer.removeSelection()
 
                     # If the selection by BBOX did not select anything, make sure we fool `QgsOfflineEditing` something is selected.
                     # Otherwise when `layer.selectedFeatureIds().isEmpty()`, `QgsOfflineEditing` dumps all features.
@@ -423,24 +442,11 @@ class PythonMiniOffliner(BaseOffliner):
             # Here we get the first layer for convenience, but it doesn't really matter.
             layer_to_offline = layer_infos[0].layer
 
-            if Qgis.QGIS_VERSION_INT >= 33000:
-                no_geometry_types = [
-                    Qgis.GeometryType.Null,
-                    Qgis.GeometryType.Unknown,
-                ]
-            else:
-                from qgis.core import QgsWkbTypes
-
-                no_geometry_types = [
-                    QgsWkbTypes.GeometryType.NullGeometry,
-                    QgsWkbTypes.GeometryType.UnknownGeometry,
-                ]
-
             # If `bbox` is valid and not empty and the layer is not geometry-less
             if (
                 bbox
                 and bbox.isFinite()
-                and layer_to_offline.geometryType() not in no_geometry_types
+                and layer_to_offline.geometryType() not in _NO_GEOMETRY_TYPES
             ):
                 tr = QgsCoordinateTransform(
                     project.crs(), layer_to_offline.crs(), project
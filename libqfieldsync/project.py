@@ -1,4 +1,8 @@
 import json
+from typing import Any, Dict
+
+# sentinel distinguishing "never read" from cached falsy values
+_UNSET = object()
 
 
 class ProjectProperties(object):
@@ -47,32 +51,130 @@ class ProjectProperties(object):
         INFORM_ENTER_LEAVE_AREAS = 3
 
 
+_VALID_BASE_MAP_TYPES = frozenset(
+    (
+        ProjectProperties.BaseMapType.SINGLE_LAYER,
+        ProjectProperties.BaseMapType.MAP_THEME,
+    )
+)
+
+
+class _ProjectEntry:
+    """Descriptor for a single "qfieldsync" entry stored in the project file.
+
+    Replaces the former nearly-identical `@property` getter/setter pairs: each
+    attribute only differs in the entry key, the `QgsProject` reader method and
+    the default, so one parameterized descriptor covers them all. Reads fill
+    the per-instance cache (see `ProjectConfiguration.__init__`), writes go
+    through to the project and update the cache.
+    """
+
+    __slots__ = ("key", "reader", "default", "writer")
+
+    def __init__(self, key, reader="readEntry", default=_UNSET, writer="writeEntry"):
+        self.key = key
+        self.reader = reader
+        self.default = default
+        self.writer = writer
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+
+        value = obj._cached_entries.get(self.key, _UNSET)
+        if value is _UNSET:
+            if self.default is _UNSET:
+                value, _ = getattr(obj.project, self.reader)("qfieldsync", self.key)
+            else:
+                value, _ = getattr(obj.project, self.reader)(
+                    "qfieldsync", self.key, self.default
+                )
+            obj._cached_entries[self.key] = value
+        return value
+
+    def __set__(self, obj, value):
+        getattr(obj.project, self.writer)("qfieldsync", self.key, value)
+        obj._cached_entries[self.key] = value
+
+
 class ProjectConfiguration(object):
     """
     Manages the QFieldSync specific configuration for a QGIS project.
     """
 
+    __slots__ = ("project", "_cached_entries")
+
+    create_base_map = _ProjectEntry(
+        ProjectProperties.CREATE_BASE_MAP, "readBoolEntry", False
+    )
+    base_map_theme = _ProjectEntry(ProjectProperties.BASE_MAP_THEME)
+    base_map_layer = _ProjectEntry(ProjectProperties.BASE_MAP_LAYER)
+    digitizing_logs_layer = _ProjectEntry(ProjectProperties.DIGITIZING_LOGS_LAYER)
+    geofencing_layer = _ProjectEntry(ProjectProperties.GEOFENCING_LAYER)
+    geofencing_behavior = _ProjectEntry(
+        ProjectProperties.GEOFENCING_BEHAVIOR,
+        "readNumEntry",
+        ProjectProperties.GeofencingBehavior.ALERT_INSIDE_AREAS,
+    )
+    geofencing_should_prevent_digitizing = _ProjectEntry(
+        ProjectProperties.GEOFENCING_SHOULD_PREVENT_DIGITIZING, "readBoolEntry", False
+    )
+    geofencing_is_active = _ProjectEntry(
+        ProjectProperties.GEOFENCING_IS_ACTIVE, "readBoolEntry", False
+    )
+    maximum_image_width_height = _ProjectEntry(
+        ProjectProperties.MAXIMUM_IMAGE_WIDTH_HEIGHT, "readNumEntry", 0
+    )
+    force_auto_push = _ProjectEntry(
+        ProjectProperties.FORCE_AUTO_PUSH, "readBoolEntry", False
+    )
+    force_auto_push_interval_mins = _ProjectEntry(
+        ProjectProperties.FORCE_AUTO_PUSH_INTERVAL_MINS, "readNumEntry", 30
+    )
+    base_map_tile_size = _ProjectEntry(
+        ProjectProperties.BASE_MAP_TILE_SIZE, "readNumEntry", 1024
+    )
+    base_map_mupp = _ProjectEntry(
+        ProjectProperties.BASE_MAP_MUPP,
+        "readDoubleEntry",
+        10.0,
+        writer="writeEntryDouble",
+    )
+    offline_copy_only_aoi = _ProjectEntry(
+        ProjectProperties.OFFLINE_COPY_ONLY_AOI, "readBoolEntry"
+    )
+    original_project_path = _ProjectEntry(ProjectProperties.ORIGINAL_PROJECT_PATH)
+    imported_files_checksums = _ProjectEntry(
+        ProjectProperties.IMPORTED_FILES_CHECKSUMS, "readListEntry"
+    )
+    layer_action_preference = _ProjectEntry(ProjectProperties.LAYER_ACTION_PREFERENCE)
+    area_of_interest = _ProjectEntry(ProjectProperties.AREA_OF_INTEREST)
+    area_of_interest_crs = _ProjectEntry(ProjectProperties.AREA_OF_INTEREST_CRS)
+
     def __init__(self, project):
         self.project = project
+        # `QgsProject.readEntry` and friends deserialize the stored entry on
+        # every call, while the same keys are read over and over during a
+        # single export or check run; cache the values per instance and let
+        # the descriptor writes go through
+        self._cached_entries: Dict[str, Any] = {}
 
-    @property
-    def create_base_map(self):
-        create_base_map, _ = self.project.readBoolEntry(
-            "qfieldsync", ProjectProperties.CREATE_BASE_MAP, False
-        )
-        return create_base_map
-
-    @create_base_map.setter
-    def create_base_map(self, value):
-        self.project.writeEntry("qfieldsync", ProjectProperties.CREATE_BASE_MAP, value)
+    # `base_map_type` normalizes the stored value and validates on write, and
+    # `map_themes_active_layer` is JSON encoded; both keep explicit properties
 
     @property
     def base_map_type(self):
-        base_map_type, _ = self.project.readEntry(
-            "qfieldsync",
-            ProjectProperties.BASE_MAP_TYPE,
-            ProjectProperties.BaseMapType.SINGLE_LAYER,
-        )
+        base_map_type = self._cached_entries.get(
+            ProjectProperties.BASE_MAP_TYPE, _UNSET
+        )
+        if base_map_type is _UNSET:
+            base_map_type, _ = self.project.readEntry(
+                "qfieldsync",
+                ProjectProperties.BASE_MAP_TYPE,
+                ProjectProperties.BaseMapType.SINGLE_LAYER,
+            )
+            self._cached_entries[ProjectProperties.BASE_MAP_TYPE] = base_map_type
+
         if base_map_type != ProjectProperties.BaseMapType.SINGLE_LAYER:
             return ProjectProperties.BaseMapType.MAP_THEME
         else:
@@ -80,95 +182,28 @@ class ProjectConfiguration(object):
 
     @base_map_type.setter
     def base_map_type(self, value):
-        if (
-            value != ProjectProperties.BaseMapType.SINGLE_LAYER
-            and value != ProjectProperties.BaseMapType.MAP_THEME
-        ):
+        if value not in _VALID_BASE_MAP_TYPES:
             raise ValueError("Only supported types can be set")
 
         self.project.writeEntry("qfieldsync", ProjectProperties.BASE_MAP_TYPE, value)
-
-    @property
-    def base_map_theme(self):
-        base_map_theme, _ = self.project.readEntry(
-            "qfieldsync", ProjectProperties.BASE_MAP_THEME
-        )
-        return base_map_theme
-
-    @base_map_theme.setter
-    def base_map_theme(self, value):
-        self.project.writeEntry("qfieldsync", ProjectProperties.BASE_MAP_THEME, value)
-
-    @property
-    def base_map_layer(self):
-        base_map_layer, _ = self.project.readEntry(
-            "qfieldsync", ProjectProperties.BASE_MAP_LAYER
-        )
-        return base_map_layer
-
-    @base_map_layer.setter
-    def base_map_layer(self, value):
-        self.project.writeEntry("qfieldsync", ProjectProperties.BASE_MAP_LAYER, value)
-
-    @property
-    def digitizing_logs_layer(self):
-        digitizing_logs_layer, _ = self.project.readEntry(
-            "qfieldsync", ProjectProperties.DIGITIZING_LOGS_LAYER
-        )
-        return digitizing_logs_layer
-
-    @digitizing_logs_layer.setter
-    def digitizing_logs_layer(self, value):
-        self.project.writeEntry(
-            "qfieldsync", ProjectProperties.DIGITIZING_LOGS_LAYER, value
-        )
-
-    @property
-    def geofencing_layer(self):
-        geofencing_layer, _ = self.project.readEntry(
-            "qfieldsync", ProjectProperties.GEOFENCING_LAYER
-        )
-        return geofencing_layer
-
-    @geofencing_layer.setter
-    def geofencing_layer(self, value):
-        self.project.writeEntry("qfieldsync", ProjectProperties.GEOFENCING_LAYER, value)
-
-    @property
-    def geofencing_behavior(self):
-        geofencing_behavior, _ = self.project.readNumEntry(
-            "qfieldsync",
-            ProjectProperties.GEOFENCING_BEHAVIOR,
-            ProjectProperties.GeofencingBehavior.ALERT_INSIDE_AREAS,
-        )
-        return geofencing_behavior
-
-    @geofencing_behavior.setter
-    def geofencing_behavior(self, value):
-        self.project.writeEntry(
-            "qfieldsync", ProjectProperties.GEOFENCING_BEHAVIOR, value
-        )
-
-    @property
-    def geofencing_should_prevent_digitizing(self):
-        geofencing_should_prevent_digitizing, _ = self.project.readBoolEntry(
-            "qfieldsync", ProjectProperties.GEOFENCING_SHOULD_PREVENT_DIGITIZING, False
-        )
-        return geofencing_should_prevent_digitizing
-
-    @geofencing_should_prevent_digitizing.setter
-    def geofencing_should_prevent_digitizing(self, value):
-        self.project.writeEntry(
-            "qfieldsync", ProjectProperties.GEOFENCING_SHOULD_PREVENT_DIGITIZING, value
-        )
+        self._cached_entries[ProjectProperties.BASE_MAP_TYPE] = value
 
     @property
     def map_themes_active_layer(self):
-        entries_json, _ = self.project.readEntry(
-            "qfieldsync", ProjectProperties.MAP_THEMES_ACTIVE_LAYER
+        entries_json = self._cached_entries.get(
+            ProjectProperties.MAP_THEMES_ACTIVE_LAYER, _UNSET
         )
+        if entries_json is _UNSET:
+            entries_json, _ = self.project.readEntry(
+                "qfieldsync", ProjectProperties.MAP_THEMES_ACTIVE_LAYER
+            )
+            self._cached_entries[
+                ProjectProperties.MAP_THEMES_ACTIVE_LAYER
+            ] = entries_json
 
         try:
+            # decode per access, so callers may mutate the returned dict
+            # without poisoning the cached entry
             entries = json.loads(entries_json)
         except Exception:
             entries = {}
@@ -177,160 +212,8 @@ class ProjectConfiguration(object):
 
     @map_themes_active_layer.setter
     def map_themes_active_layer(self, value):
+        entries_json = json.dumps(value)
         self.project.writeEntry(
-            "qfieldsync",
-            ProjectProperties.MAP_THEMES_ACTIVE_LAYER,
-            json.dumps(value),
-        )
-
-    @property
-    def geofencing_is_active(self):
-        geofencing_is_active, _ = self.project.readBoolEntry(
-            "qfieldsync", ProjectProperties.GEOFENCING_IS_ACTIVE, False
-        )
-        return geofencing_is_active
-
-    @geofencing_is_active.setter
-    def geofencing_is_active(self, value):
-        self.project.writeEntry(
-            "qfieldsync", ProjectProperties.GEOFENCING_IS_ACTIVE, value
-        )
-
-    @property
-    def maximum_image_width_height(self):
-        maximum_image_width_height, _ = self.project.readNumEntry(
-            "qfieldsync", ProjectProperties.MAXIMUM_IMAGE_WIDTH_HEIGHT, 0
-        )
-        return maximum_image_width_height
-
-    @maximum_image_width_height.setter
-    def maximum_image_width_height(self, value):
-        self.project.writeEntry(
-            "qfieldsync", ProjectProperties.MAXIMUM_IMAGE_WIDTH_HEIGHT, value
-        )
-
-    @property
-    def force_auto_push(self):
-        force_auto_push, _ = self.project.readBoolEntry(
-            "qfieldsync", ProjectProperties.FORCE_AUTO_PUSH, False
-        )
-        return force_auto_push
-
-    @force_auto_push.setter
-    def force_auto_push(self, value):
-        self.project.writeEntry("qfieldsync", ProjectProperties.FORCE_AUTO_PUSH, value)
-
-    @property
-    def force_auto_push_interval_mins(self):
-        force_auto_push_interval_mins, _ = self.project.readNumEntry(
-            "qfieldsync", ProjectProperties.FORCE_AUTO_PUSH_INTERVAL_MINS, 30
-        )
-        return force_auto_push_interval_mins
-
-    @force_auto_push_interval_mins.setter
-    def force_auto_push_interval_mins(self, value):
-        self.project.writeEntry(
-            "qfieldsync", ProjectProperties.FORCE_AUTO_PUSH_INTERVAL_MINS, value
-        )
-
-    @property
-    def base_map_tile_size(self):
-        base_map_tile_size, _ = self.project.readNumEntry(
-            "qfieldsync", ProjectProperties.BASE_MAP_TILE_SIZE, 1024
-        )
-        return base_map_tile_size
-
-    @base_map_tile_size.setter
-    def base_map_tile_size(self, value):
-        self.project.writeEntry(
-            "qfieldsync", ProjectProperties.BASE_MAP_TILE_SIZE, value
-        )
-
-    @property
-    def base_map_mupp(self):
-        base_map_mupp, _ = self.project.readDoubleEntry(
-            "qfieldsync", ProjectProperties.BASE_MAP_MUPP, 10.0
-        )
-        return base_map_mupp
-
-    @base_map_mupp.setter
-    def base_map_mupp(self, value):
-        self.project.writeEntryDouble(
-            "qfieldsync", ProjectProperties.BASE_MAP_MUPP, value
-        )
-
-    @property
-    def offline_copy_only_aoi(self):
-        offline_copy_only_aoi, _ = self.project.readBoolEntry(
-            "qfieldsync", ProjectProperties.OFFLINE_COPY_ONLY_AOI
-        )
-        return offline_copy_only_aoi
-
-    @offline_copy_only_aoi.setter
-    def offline_copy_only_aoi(self, value):
-        self.project.writeEntry(
-            "qfieldsync", ProjectProperties.OFFLINE_COPY_ONLY_AOI, value
-        )
-
-    @property
-    def original_project_path(self):
-        original_project_path, _ = self.project.readEntry(
-            "qfieldsync", ProjectProperties.ORIGINAL_PROJECT_PATH
-        )
-        return original_project_path
-
-    @original_project_path.setter
-    def original_project_path(self, value):
-        self.project.writeEntry(
-            "qfieldsync", ProjectProperties.ORIGINAL_PROJECT_PATH, value
-        )
-
-    @property
-    def imported_files_checksums(self):
-        imported_files_checksums, _ = self.project.readListEntry(
-            "qfieldsync", ProjectProperties.IMPORTED_FILES_CHECKSUMS
-        )
-        return imported_files_checksums
-
-    @imported_files_checksums.setter
-    def imported_files_checksums(self, value):
-        self.project.writeEntry(
-            "qfieldsync", ProjectProperties.IMPORTED_FILES_CHECKSUMS, value
-        )
-
-    @property
-    def layer_action_preference(self):
-        layer_action_preference, _ = self.project.readEntry(
-            "qfieldsync", ProjectProperties.LAYER_ACTION_PREFERENCE
-        )
-        return layer_action_preference
-
-    @layer_action_preference.setter
-    def layer_action_preference(self, value):
-        self.project.writeEntry(
-            "qfieldsync", ProjectProperties.LAYER_ACTION_PREFERENCE, value
-        )
-
-    @property
-    def area_of_interest(self):
-        area_of_interest, _ = self.project.readEntry(
-            "qfieldsync", ProjectProperties.AREA_OF_INTEREST
-        )
-        return area_of_interest
-
-    @area_of_interest.setter
-    def area_of_interest(self, value):
-        self.project.writeEntry("qfieldsync", ProjectProperties.AREA_OF_INTEREST, value)
-
-    @property
-    def area_of_interest_crs(self):
-        area_of_interest_crs, _ = self.project.readEntry(
-            "qfieldsync", ProjectProperties.AREA_OF_INTEREST_CRS
-        )
-        return area_of_interest_crs
-
-    @area_of_interest_crs.setter
-    def area_of_interest_crs(self, value):
-        self.project.writeEntry(
-            "qfieldsync", ProjectProperties.AREA_OF_INTEREST_CRS, value
+            "qfieldsync", ProjectProperties.MAP_THEMES_ACTIVE_LAYER, entries_json
         )
+        self._cached_entries[ProjectProperties.MAP_THEMES_ACTIVE_LAYER] = entries_json
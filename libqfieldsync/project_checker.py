@@ -1,29 +1,119 @@
-import sys
+import concurrent.futures
+import os
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 
 from qgis.core import Qgis, QgsMapLayer, QgsProject, QgsSettings
 from qgis.PyQt.QtCore import QObject
 
 from libqfieldsync.layer import LayerSource, SyncAction, UnsupportedPrimaryKeyError
 from libqfieldsync.project import ProjectConfiguration, ProjectProperties
-from libqfieldsync.utils.file_utils import isascii, is_valid_filepath
+from libqfieldsync.utils.file_utils import is_valid_filename
 
 from .offline_converter import ExportType
 
-if sys.version_info >= (3, 8):
-    from typing import TypedDict
-else:
-    TypedDict = Dict
+# run the per-layer checks in a thread pool only when there are enough layers
+# to pay off the thread startup overhead
+_PARALLEL_CHECKS_MIN_LAYERS = 32
+
+# the QGIS version cannot change within the process, so resolve the
+# SIP-wrapped constant once; `QgsProject.filePathStorage()` exists since 3.22
+_HAS_FILE_PATH_STORAGE = Qgis.QGIS_VERSION_INT >= 32200
+
+# stop walking the project directory once this many offending paths are
+# found; the feedback message would be unreadable beyond that anyway
+_MAX_REPORTED_PROBLEMATIC_PATHS = 20
+
+# Static feedback messages are translated once at import time, so the checks
+# do not cross the Qt translation bridge again for every checked layer.
+_tr = QObject().tr
+
+_MSG_ABSOLUTE_FILEPATHS = _tr(
+    "QField does not support projects configured to use absolute paths. "
+    'Please change this configuration in "File -> Project settings" first.'
+)
+_MSG_HOMEPATH = _tr(
+    "QField does not support projects with configured home path. "
+    'Please change this configuration in "File -> Project settings" first.'
+)
+_MSG_NO_BASEMAP_LAYER = _tr(
+    "No basemap layer selected. "
+    'Please change this configuration in "File -> Project settings -> QField" first.'
+)
+_MSG_BASEMAP_LAYER_NOT_FOUND = _tr(
+    'Cannot find the configured base layer with id "{}". '
+    'Please change this configuration in "File -> Project settings -> QField" first.'
+)
+_MSG_BASEMAP_THEME_NOT_FOUND = _tr(
+    'Cannot find the configured base theme with name "{}".'
+    'Please change this configuration in "File -> Project settings -> QField" first.'
+)
+_MSG_UNSUPPORTED_CHARACTERS = _tr(
+    'Forbidden characters in filesystem path(s) "{}". '
+    'Please make sure there are no files and directories with "<", ">", ":", "/", "\\", "|", "?", "*" or double quotes (") characters in their path.'
+    "and must not be reserved names like CON, PRN, AUX, NUL, etc."
+)
+_MSG_PROJECT_IS_DIRTY = _tr(
+    "QGIS project has unsaved changes. "
+    "Unsaved changes will not be uploaded to QFieldCloud."
+)
+_MSG_NOT_UTF8 = _tr(
+    'Layer does not use UTF-8, but "{}" encoding. '
+    "Working with layers that do not use UTF-8 encoding might cause problems. "
+    "It is highly recommended to convert them to UTF-8 encoded layers. "
+)
+_MSG_NON_ASCII_FILENAME = _tr(
+    "Non ASCII character detected in the layer filename {}. "
+    "Working with file paths that are not in ASCII might cause problems. "
+    "It is highly recommended to rename them to ASCII encoded paths. "
+)
+_MSG_UNSUPPORTED_PK_SUFFIX = _tr(
+    "The layer will be packaged **as a read-only layer on QFieldCloud**. "
+    "Geopackages are [the recommended data format for QFieldCloud](https://docs.qfield.org/get-started/tutorials/get-started-qfc/#configure-your-project-layers-for-qfield). "
+)
+_MSG_MEMORY_LAYER = _tr(
+    "Memory layer features are only available during this QGIS session. "
+    "The layer will be empty on QField."
+)
+_MSG_LAYER_NOT_CONFIGURED = _tr(
+    "The layer is not configured with neither cable, nor cloud action yet. "
+    "Default action will be selected only for this time. "
+    'Please select and save appropriate layer action in "Layer Properties -> QField". '
+)
+_MSG_LAYER_WILL_BE_REMOVED = _tr("The layer will be removed from the packaged project.")
+_MSG_LAYER_DATA_NOT_PACKAGED = _tr("The layer's data will not be packaged!")
+_MSG_REASON_INVALID = _tr("The layer is invalid!")
+_MSG_REASON_INVALID_REMOTE_RASTER = _tr(
+    "The raster layer data source is not accessible from the current network!"
+)
+_MSG_REASON_UNSUPPORTED_DATASOURCE = _tr(
+    "The layer data source is not supported on QField!"
+)
+_MSG_REASON_LOCALIZED_PATH = _tr("The layer is localized data path!")
+_REASON_MESSAGES = {
+    LayerSource.PackagePreventionReason.INVALID: _MSG_REASON_INVALID,
+    LayerSource.PackagePreventionReason.INVALID_REMOTE_RASTER_LAYER: _MSG_REASON_INVALID_REMOTE_RASTER,
+    LayerSource.PackagePreventionReason.UNSUPPORTED_DATASOURCE: _MSG_REASON_UNSUPPORTED_DATASOURCE,
+    LayerSource.PackagePreventionReason.LOCALIZED_PATH: _MSG_REASON_LOCALIZED_PATH,
+}
+_MSG_LAYER_OUTSIDE_HOME_DIR = _tr(
+    'Layer "{}" is outside the project\'s home directory. '
+    "QFieldSync may not transfer your layer. "
+    'Please move the file to "{}".'
+)
 
 
 class FeedbackResult:
+    __slots__ = ("message",)
+
     def __init__(self, message: str) -> None:
         self.message = message
 
 
 class Feedback:
+    __slots__ = ("level", "message", "layer_id", "layer_name")
+
     class Level(Enum):
         ERROR = "ERROR"
         WARNING = "WARNING"
@@ -37,8 +127,12 @@ class Feedback:
         self.layer_name = layer.name() if layer else None
 
 
+# constant across the program; computed once instead of per instance
+_LONGEST_LEVEL_NAME = max(len(level.value) for level in Feedback.Level)
+
+
 class ProjectCheckerFeedback:
-    tr = QObject().tr
+    __slots__ = ("feedbacks", "count", "error_feedbacks", "longest_level_name")
 
     def __init__(self) -> None:
         self.feedbacks: Dict[str, List[Feedback]] = {
@@ -47,132 +141,100 @@ class ProjectCheckerFeedback:
         }
         self.count = 0
         self.error_feedbacks: List[Feedback] = []
-        self.longest_level_name = len(Feedback.Level.WARNING.value)
+        self.longest_level_name = _LONGEST_LEVEL_NAME
 
     def add(self, feedback: Feedback):
         # if the key is "", it is considered as project feedback
         layer_id_key = feedback.layer_id or ""
         self.count += 1
-        self.feedbacks[layer_id_key] = self.feedbacks.get(layer_id_key, [])
-        self.feedbacks[layer_id_key].append(feedback)
+        self.feedbacks.setdefault(layer_id_key, []).append(feedback)
 
-        if feedback.level == Feedback.Level.ERROR:
+        if feedback.level is Feedback.Level.ERROR:
             self.error_feedbacks.append(feedback)
 
 
 class ProjectChecker:
-    tr = QObject().tr
-
-    class CheckConfig(TypedDict):
-        type: Feedback.Level
+    class CheckConfig(NamedTuple):
+        type: "Feedback.Level"
         fn: Callable
         scope: Optional[ExportType]
 
     def __init__(self, project: QgsProject) -> None:
         self.project = project
-        self.project_checks: List[ProjectChecker.CheckConfig] = [
-            {
-                "type": Feedback.Level.ERROR,
-                "fn": self.check_no_absolute_filepaths,
-                "scope": None,
-            },
-            {
-                "type": Feedback.Level.ERROR,
-                "fn": self.check_no_homepath,
-                "scope": None,
-            },
-            {
-                "type": Feedback.Level.ERROR,
-                "fn": self.check_files_have_unsupported_characters,
-                "scope": None,
-            },
-            {
-                "type": Feedback.Level.WARNING,
-                "fn": self.check_project_is_dirty,
-                "scope": ExportType.Cloud,
-            },
-        ]
-        self.layer_checks: List[ProjectChecker.CheckConfig] = [
-            {
-                "type": Feedback.Level.WARNING,
-                "fn": self.check_layer_has_utf8_datasources,
-                "scope": None,
-            },
-            {
-                "type": Feedback.Level.WARNING,
-                "fn": self.check_layer_has_ascii_filename,
-                "scope": None,
-            },
-            {
-                "type": Feedback.Level.WARNING,
-                "fn": self.check_external_layers,
-                "scope": None,
-            },
-            {
-                "type": Feedback.Level.WARNING,
-                "fn": self.check_layer_primary_key,
-                "scope": ExportType.Cloud,
-            },
-            {
-                "type": Feedback.Level.WARNING,
-                "fn": self.check_layer_memory,
-                "scope": None,
-            },
-            {
-                "type": Feedback.Level.WARNING,
-                "fn": self.check_layer_configured,
-                "scope": None,
-            },
-            {
-                "type": Feedback.Level.WARNING,
-                "fn": self.check_layer_package_prevention,
-                "scope": None,
-            },
-        ]
+        # a single instance, so the per-instance entry cache in
+        # `ProjectConfiguration` spans all checks of this checker
+        self.project_configuration = ProjectConfiguration(project)
 
     def check(self, scope: ExportType) -> ProjectCheckerFeedback:
         checked_feedback = ProjectCheckerFeedback()
+        # NOTE `QgsProject.mapLayers()` builds a fresh dict on every call, so materialize it once
+        layers = list(self.project.mapLayers().values())
 
-        for check in self.project_checks:
-            if check["scope"] and check["scope"] != scope:
+        for check_type, check_fn, check_scope in self.project_checks:
+            if check_scope and check_scope != scope:
                 continue
 
-            feedback_result = check["fn"]()
+            feedback_result = check_fn(self)
             if feedback_result:
-                checked_feedback.add(Feedback(check["type"], feedback_result))
+                checked_feedback.add(Feedback(check_type, feedback_result))
+
+        if len(layers) > _PARALLEL_CHECKS_MIN_LAYERS:
+            # the layer checks only read their own layer, so run them in parallel;
+            # the provider introspection calls release the GIL in the QGIS C++ code
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                layers_feedbacks = list(
+                    executor.map(
+                        lambda layer: self._run_layer_checks(scope, layer), layers
+                    )
+                )
+        else:
+            layers_feedbacks = [
+                self._run_layer_checks(scope, layer) for layer in layers
+            ]
+
+        for feedbacks in layers_feedbacks:
+            for feedback in feedbacks:
+                checked_feedback.add(feedback)
+
+        return checked_feedback
+
+    def _run_layer_checks(
+        self, scope: ExportType, layer: QgsMapLayer
+    ) -> List[Feedback]:
+        feedbacks: List[Feedback] = []
+
+        # skip the full `LayerSource` construction for layers explicitly
+        # removed from both exports; they produce no feedback anyway
+        if LayerSource.is_both_removed(layer):
+            return feedbacks
+
+        layer_source = LayerSource(layer)
 
-        for layer in self.project.mapLayers().values():
-            layer_source = LayerSource(layer)
+        # `action`/`cloud_action` are properties; evaluate them once instead
+        # of per check iteration
+        is_cable_removed = layer_source.action == SyncAction.REMOVE
+        is_cloud_removed = layer_source.cloud_action == SyncAction.REMOVE
 
-            if (
-                layer_source.action == SyncAction.REMOVE
-                and layer_source.cloud_action == SyncAction.REMOVE
+        if is_cable_removed and is_cloud_removed:
+            return feedbacks
+
+        for check_type, check_fn, check_scope in self.layer_checks:
+            if (check_scope == ExportType.Cable and is_cable_removed) or (
+                check_scope == ExportType.Cloud and is_cloud_removed
             ):
+                break
+
+            if check_scope and check_scope != scope:
                 continue
 
-            for check in self.layer_checks:
-                if (
-                    check["scope"] == ExportType.Cable
-                    and layer_source.action == SyncAction.REMOVE
-                ) or (
-                    check["scope"] == ExportType.Cloud
-                    and layer_source.cloud_action == SyncAction.REMOVE
-                ):
-                    break
-
-                if check["scope"] and check["scope"] != scope:
-                    continue
-
-                feedback_result = check["fn"](layer_source)
-                if feedback_result:
-                    checked_feedback.add(
-                        Feedback(check["type"], feedback_result, layer)
-                    )
+            feedback_result = check_fn(self, layer_source)
+            if feedback_result:
+                feedbacks.append(Feedback(check_type, feedback_result, layer))
 
-        return checked_feedback
+        return feedbacks
 
     def check_no_absolute_filepaths(self) -> Optional[FeedbackResult]:
-        if Qgis.QGIS_VERSION_INT >= 32200:
+        if _HAS_FILE_PATH_STORAGE:
             is_absolute = self.project.filePathStorage() == Qgis.FilePathType.Absolute
         else:
             is_absolute = (
@@ -180,28 +242,18 @@ class ProjectChecker:
             )
 
         if is_absolute:
-            return FeedbackResult(
-                self.tr(
-                    "QField does not support projects configured to use absolute paths. "
-                    'Please change this configuration in "File -> Project settings" first.'
-                )
-            )
+            return FeedbackResult(_MSG_ABSOLUTE_FILEPATHS)
         else:
             return None
 
     def check_no_homepath(self) -> Optional[FeedbackResult]:
         if self.project.presetHomePath():
-            return FeedbackResult(
-                self.tr(
-                    "QField does not support projects with configured home path. "
-                    'Please change this configuration in "File -> Project settings" first.'
-                )
-            )
+            return FeedbackResult(_MSG_HOMEPATH)
         else:
             return None
 
     def check_basemap_configuration(self) -> Optional[FeedbackResult]:
-        project_configuration = ProjectConfiguration(self.project)
+        project_configuration = self.project_configuration
 
         if not project_configuration.create_base_map:
             return None
@@ -209,72 +261,75 @@ class ProjectChecker:
         base_map_type = project_configuration.base_map_type
 
         if base_map_type == ProjectProperties.BaseMapType.SINGLE_LAYER:
-            basemap_layer = self.project.mapLayer(project_configuration.base_map_layer)
+            base_map_layer_id = project_configuration.base_map_layer
 
-            if not project_configuration.base_map_layer.strip():
-                return FeedbackResult(
-                    self.tr(
-                        "No basemap layer selected. "
-                        'Please change this configuration in "File -> Project settings -> QField" first.'
-                    )
-                )
-            elif not basemap_layer:
+            if not base_map_layer_id.strip():
+                return FeedbackResult(_MSG_NO_BASEMAP_LAYER)
+            elif not self.project.mapLayer(base_map_layer_id):
                 return FeedbackResult(
-                    self.tr(
-                        'Cannot find the configured base layer with id "{}". '
-                        'Please change this configuration in "File -> Project settings -> QField" first.'
-                    ).format(project_configuration.base_map_layer),
+                    _MSG_BASEMAP_LAYER_NOT_FOUND.format(base_map_layer_id),
                 )
 
         elif base_map_type == ProjectProperties.BaseMapType.MAP_THEME:
-            if not self.project.mapThemeCollection().hasMapTheme(
-                project_configuration.base_map_theme
-            ):
+            base_map_theme = project_configuration.base_map_theme
+
+            if not self.project.mapThemeCollection().hasMapTheme(base_map_theme):
                 return FeedbackResult(
-                    self.tr(
-                        'Cannot find the configured base theme with name "{}".'
-                        'Please change this configuration in "File -> Project settings -> QField" first.'
-                    ).format(project_configuration.base_map_theme),
+                    _MSG_BASEMAP_THEME_NOT_FOUND.format(base_map_theme),
                 )
         return None
 
     def check_files_have_unsupported_characters(self) -> Optional[FeedbackResult]:
-        problematic_paths = []
-        home_path = Path(self.project.fileName()).parent
-        try:
-            for path in home_path.rglob("*"):
-                relative_path = path.relative_to(home_path)
+        project_filename = self.project.fileName()
 
-                if str(relative_path).startswith(".qfieldsync"):
-                    continue
+        # unsaved projects have no home directory to walk
+        if not project_filename:
+            return None
 
-                if not is_valid_filepath(str(relative_path.as_posix())):
-                    problematic_paths.append(relative_path)
+        problematic_paths = []
+        home_path = os.path.dirname(project_filename)
+
+        # `os.walk` is `os.scandir` based and lets us prune `.qfieldsync`
+        # before descending into it, while the previous `Path.rglob("*")`
+        # statted every entry below it just to filter the results afterwards.
+        # Validating each entry name once also spares re-checking all of its
+        # ancestor parts for every file below them, and unreadable directories
+        # (e.g. overlong paths on Windows) are skipped instead of aborting.
+        for dirpath, dirnames, filenames in os.walk(home_path):
+            if dirpath == home_path:
+                dirnames[:] = [
+                    dirname
+                    for dirname in dirnames
+                    if not dirname.startswith(".qfieldsync")
+                ]
+                filenames = [
+                    filename
+                    for filename in filenames
+                    if not filename.startswith(".qfieldsync")
+                ]
+
+            for name in dirnames + filenames:
+                if not is_valid_filename(name):
+                    problematic_paths.append(
+                        os.path.relpath(os.path.join(dirpath, name), home_path)
+                    )
 
-        except FileNotFoundError:
-            # long paths on windows will raise a FileNotFoundError in rglob, so we have to handle
-            # that gracefully
-            pass
+            if len(problematic_paths) >= _MAX_REPORTED_PROBLEMATIC_PATHS:
+                break
 
         if problematic_paths:
-            return FeedbackResult(
-                self.tr(
-                    'Forbidden characters in filesystem path(s) "{}". '
-                    'Please make sure there are no files and directories with "<", ">", ":", "/", "\\", "|", "?", "*" or double quotes (") characters in their path.'
-                    "and must not be reserved names like CON, PRN, AUX, NUL, etc."
-                ).format(", ".join([f'"{path}"' for path in problematic_paths]))
-            )
+            paths_str = ", ".join(f'"{path}"' for path in problematic_paths)
+
+            if len(problematic_paths) >= _MAX_REPORTED_PROBLEMATIC_PATHS:
+                paths_str += ", …"
+
+            return FeedbackResult(_MSG_UNSUPPORTED_CHARACTERS.format(paths_str))
         else:
             return None
 
     def check_project_is_dirty(self) -> Optional[FeedbackResult]:
         if self.project.isDirty():
-            return FeedbackResult(
-                self.tr(
-                    "QGIS project has unsaved changes. "
-                    "Unsaved changes will not be uploaded to QFieldCloud."
-                )
-            )
+            return FeedbackResult(_MSG_PROJECT_IS_DIRTY)
         else:
             return None
 
@@ -283,19 +338,17 @@ class ProjectChecker:
     ) -> Optional[FeedbackResult]:
         layer = layer_source.layer
 
-        if (
-            layer.type() == QgsMapLayer.VectorLayer
-            and layer.dataProvider()
-            and layer.dataProvider().encoding() != "UTF-8"
-            # some providers return empty string as encoding, just ignore them
-            and layer.dataProvider().encoding() != ""
-        ):
+        # bind the provider and its encoding once — `dataProvider()` and
+        # `encoding()` are both C++ hops and were called up to four times here
+        provider = (
+            layer.dataProvider() if layer.type() == QgsMapLayer.VectorLayer else None
+        )
+        encoding = provider.encoding() if provider else ""
+
+        # some providers return empty string as encoding, just ignore them
+        if encoding and encoding != "UTF-8":
             return FeedbackResult(
-                self.tr(
-                    'Layer does not use UTF-8, but "{}" encoding. '
-                    "Working with layers that do not use UTF-8 encoding might cause problems. "
-                    "It is highly recommended to convert them to UTF-8 encoded layers. "
-                ).format(layer.dataProvider().encoding()),
+                _MSG_NOT_UTF8.format(encoding),
             )
         else:
             return None
@@ -303,13 +356,13 @@ class ProjectChecker:
     def check_layer_has_ascii_filename(
         self, layer_source: LayerSource
     ) -> Optional[FeedbackResult]:
-        if layer_source.is_file and not isascii(layer_source.filename):
+        # `filename` is derived per access (decodeUri + path resolver), and
+        # `is_file` re-derives it for its stat; compute it once and scan the
+        # string before touching the filesystem
+        filename = layer_source.filename
+        if filename and not filename.isascii() and os.path.isfile(filename):
             return FeedbackResult(
-                self.tr(
-                    "Non ASCII character detected in the layer filename {}. "
-                    "Working with file paths that are not in ASCII might cause problems. "
-                    "It is highly recommended to rename them to ASCII encoded paths. "
-                ).format(layer_source.filename),
+                _MSG_NON_ASCII_FILENAME.format(filename),
             )
         else:
             return None
@@ -338,11 +391,7 @@ class ProjectChecker:
             try:
                 layer_source.get_pk_attr_name()
             except UnsupportedPrimaryKeyError as err:
-                suffix = self.tr(
-                    "The layer will be packaged **as a read-only layer on QFieldCloud**. "
-                    "Geopackages are [the recommended data format for QFieldCloud](https://docs.qfield.org/get-started/tutorials/get-started-qfc/#configure-your-project-layers-for-qfield). "
-                )
-                return FeedbackResult(f"{str(err)} {suffix}")
+                return FeedbackResult(f"{str(err)} {_MSG_UNSUPPORTED_PK_SUFFIX}")
 
         return None
 
@@ -350,12 +399,7 @@ class ProjectChecker:
         layer = layer_source.layer
 
         if layer.isValid() and layer.dataProvider().name() == "memory":
-            return FeedbackResult(
-                self.tr(
-                    "Memory layer features are only available during this QGIS session. "
-                    "The layer will be empty on QField."
-                ),
-            )
+            return FeedbackResult(_MSG_MEMORY_LAYER)
 
         return None
 
@@ -363,13 +407,7 @@ class ProjectChecker:
         self, layer_source: LayerSource
     ) -> Optional[FeedbackResult]:
         if not layer_source.is_configured and not layer_source.is_cloud_configured:
-            return FeedbackResult(
-                self.tr(
-                    "The layer is not configured with neither cable, nor cloud action yet. "
-                    "Default action will be selected only for this time. "
-                    'Please select and save appropriate layer action in "Layer Properties -> QField". '
-                ),
-            )
+            return FeedbackResult(_MSG_LAYER_NOT_CONFIGURED)
 
         return None
 
@@ -379,35 +417,19 @@ class ProjectChecker:
         package_prevention_reasons = layer_source.package_prevention_reasons
         if package_prevention_reasons:
             # remove the layer if it is invalid or not supported datasource on QField
-            main_msg = ""
-            reason_msgs = []
-            for reason in package_prevention_reasons:
-                if reason in LayerSource.REASONS_TO_REMOVE_LAYER:
-                    main_msg = self.tr(
-                        "The layer will be removed from the packaged project."
-                    )
-                else:
-                    main_msg = self.tr("The layer's data will not be packaged!")
-
-                if reason == LayerSource.PackagePreventionReason.INVALID:
-                    reason_msgs.append(self.tr("The layer is invalid!"))
-                elif (
-                    reason
-                    == LayerSource.PackagePreventionReason.INVALID_REMOTE_RASTER_LAYER
-                ):
-                    reason_msgs.append(
-                        self.tr(
-                            "The raster layer data source is not accessible from the current network!"
-                        )
-                    )
-                elif (
-                    reason == LayerSource.PackagePreventionReason.UNSUPPORTED_DATASOURCE
-                ):
-                    reason_msgs.append(
-                        self.tr("The layer data source is not supported on QField!")
-                    )
-                elif reason == LayerSource.PackagePreventionReason.LOCALIZED_PATH:
-                    reason_msgs.append(self.tr("The layer is localized data path!"))
+            if any(
+                reason in LayerSource.REASONS_TO_REMOVE_LAYER
+                for reason in package_prevention_reasons
+            ):
+                main_msg = _MSG_LAYER_WILL_BE_REMOVED
+            else:
+                main_msg = _MSG_LAYER_DATA_NOT_PACKAGED
+
+            reason_msgs = [
+                _REASON_MESSAGES[reason]
+                for reason in package_prevention_reasons
+                if reason in _REASON_MESSAGES
+            ]
 
             main_msg += "\n\n"
             main_msg += "\n".join(f"- {r}" for r in reason_msgs)
@@ -431,11 +453,28 @@ class ProjectChecker:
 
         if home_path and home_path not in layer_path.parents:
             return FeedbackResult(
-                self.tr(
-                    'Layer "{}" is outside the project\'s home directory. '
-                    "QFieldSync may not transfer your layer. "
-                    'Please move the file to "{}".'
-                ).format(layer_source.filename, home_path)
+                _MSG_LAYER_OUTSIDE_HOME_DIR.format(layer_source.filename, home_path)
             )
 
         return None
+
+    # the check tables are class-level and shared by all instances; the
+    # functions are stored unbound and called as fn(self) or
+    # fn(self, layer_source), so no bound methods are allocated per checker
+    project_checks: Tuple[CheckConfig, ...] = (
+        CheckConfig(Feedback.Level.ERROR, check_no_absolute_filepaths, None),
+        CheckConfig(Feedback.Level.ERROR, check_no_homepath, None),
+        CheckConfig(
+            Feedback.Level.ERROR, check_files_have_unsupported_characters, None
+        ),
+        CheckConfig(Feedback.Level.WARNING, check_project_is_dirty, ExportType.Cloud),
+    )
+    layer_checks: Tuple[CheckConfig, ...] = (
+        CheckConfig(Feedback.Level.WARNING, check_layer_has_utf8_datasources, None),
+        CheckConfig(Feedback.Level.WARNING, check_layer_has_ascii_filename, None),
+        CheckConfig(Feedback.Level.WARNING, check_external_layers, None),
+        CheckConfig(Feedback.Level.WARNING, check_layer_primary_key, ExportType.Cloud),
+        CheckConfig(Feedback.Level.WARNING, check_layer_memory, None),
+        CheckConfig(Feedback.Level.WARNING, check_layer_configured, None),
+        CheckConfig(Feedback.Level.WARNING, check_layer_package_prevention, None),
+    )
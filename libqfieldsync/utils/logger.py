@@ -1,7 +1,7 @@
 import logging
 
 from qgis.core import Qgis, QgsMessageLog
-from qgis.PyQt.QtCore import QObject, pyqtSignal
+from qgis.PyQt.QtCore import QMetaMethod, QObject, pyqtSignal
 
 
 def addLoggingLevel(level_name, levelno, method_name=None):
@@ -73,6 +73,9 @@ _pythonLevelToQgisLogLevel = {
 class QgisLogObserver(QObject):
     log_signal = pyqtSignal(str, str)
 
+    def has_listeners(self) -> bool:
+        return self.isSignalConnected(QMetaMethod.fromSignal(self.log_signal))
+
     def emit(self, level: str, message: str) -> None:
         self.log_signal.emit(level, message)
 
@@ -82,19 +85,24 @@ class QgisLogHandler(logging.Handler):
 
     def __init__(self, qgis_log_observer: QgisLogObserver, *args, **kwargs) -> None:
         self.qgis_log_observer = qgis_log_observer
+        # bind the dict lookup once, `emit` runs for every log record
+        self._qgis_log_level_for = _pythonLevelToQgisLogLevel.get
         super().__init__(*args, **kwargs)
 
     def _get_qgis_log_level(self, record: logging.LogRecord) -> int:
-        return _pythonLevelToQgisLogLevel.get(record.levelno, LogNoLevel)
+        return self._qgis_log_level_for(record.levelno, LogNoLevel)
 
     def emit(self, record):
         try:
             msg = self.format(record)
-            qgis_log_level = self._get_qgis_log_level(record)
+            qgis_log_level = self._qgis_log_level_for(record.levelno, LogNoLevel)
 
             QgsMessageLog.logMessage(msg, self.source, qgis_log_level)
 
-            self.qgis_log_observer.emit(self.source, msg)
+            # crossing the signal boundary is the expensive part, skip it
+            # entirely when nobody is connected
+            if self.qgis_log_observer.has_listeners():
+                self.qgis_log_observer.emit(self.source, msg)
         except RecursionError:  # See issue 36272
             raise
         except Exception:
@@ -33,6 +33,15 @@ def get_themapcanvas(doc: QDomDocument) -> Optional[QDomElement]:
     Returns:
         Optional[QDomElement]: the "themapcanvas" element
     """
+    # `theMapCanvas` is written as a direct child of the root `qgis` element, so
+    # walk the siblings C-side instead of building a whole-tree QDomNodeList
+    el = doc.documentElement().firstChildElement("mapcanvas")
+    while not el.isNull():
+        if el.attribute("name") == "theMapCanvas":
+            return el
+        el = el.nextSiblingElement("mapcanvas")
+
+    # fallback for documents where the element is not at the root level
     nodes = doc.elementsByTagName("mapcanvas")
 
     for i in range(nodes.size()):